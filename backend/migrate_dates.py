@@ -0,0 +1,37 @@
+"""One-time migration: convert ISO string timestamps to native BSON dates.
+
+Older documents stored `added_date`, `estimated_expiry` and sensor `timestamp`
+fields as ISO strings. Run once against an existing database:
+
+    python migrate_dates.py
+"""
+from dotenv import load_dotenv
+from pymongo import MongoClient
+import os
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# Fields stored as ISO strings by earlier versions, per collection
+DATE_FIELDS = {
+    "products": ["added_date", "estimated_expiry"],
+    "sensor_readings": ["timestamp"],
+}
+
+def migrate(db):
+    """Convert string date fields in place using $toDate"""
+    for collection, fields in DATE_FIELDS.items():
+        for field in fields:
+            result = db[collection].update_many(
+                {field: {"$type": "string"}},
+                [{"$set": {field: {"$toDate": f"${field}"}}}]
+            )
+            print(f"{collection}.{field}: converted {result.modified_count} documents")
+
+if __name__ == "__main__":
+    client = MongoClient(os.environ['MONGO_URL'])
+    try:
+        migrate(client[os.environ['DB_NAME']])
+    finally:
+        client.close()
@@ -1,8 +1,11 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Response
 from dotenv import load_dotenv
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
 import os
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
@@ -10,17 +13,27 @@ from typing import List, Optional
 import uuid
 from datetime import datetime, timezone, timedelta
 import random
+from cachetools import TTLCache
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Pool sized per worker process; zstd compresses the bulk product/sensor reads
+client = AsyncIOMotorClient(
+    mongo_url,
+    tz_aware=True,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '50')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '10')),
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=5000,
+    compressors="zstd"
+)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix; responses are encoded with orjson
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -64,6 +77,23 @@ PRODUCT_CONFIGS = {
     }
 }
 
+# (optimal_temp, temp_tolerance, optimal_humidity, base_shelf_life) per product type
+SHELF_LIFE_CONFIGS = {
+    ptype.lower(): (config["optimal_temp"], config["temp_tolerance"], config["optimal_humidity"], config["base_shelf_life"])
+    for ptype, config in PRODUCT_CONFIGS.items()
+}
+
+# Static response for /product-types
+PRODUCT_TYPES = [
+    {
+        "type": ptype,
+        "icon": config["icon"],
+        "optimal_temp": config["optimal_temp"],
+        "shelf_life_days": config["base_shelf_life"]
+    }
+    for ptype, config in PRODUCT_CONFIGS.items()
+]
+
 # Define Models
 class Product(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -97,25 +127,28 @@ class SensorReading(BaseModel):
     humidity: float
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class SensorSimulationRequest(BaseModel):
+    product_ids: List[str] = Field(min_length=1)
+
 def calculate_shelf_life(product_type: str, added_date: datetime, current_temp: float, current_humidity: float):
     """Calculate remaining shelf life based on storage conditions"""
-    config = PRODUCT_CONFIGS.get(product_type.lower())
+    config = SHELF_LIFE_CONFIGS.get(product_type.lower())
     if not config:
         return 100.0, "fresh", None
+    optimal_temp, temp_tolerance, optimal_humidity, base_shelf_life = config
     
     # Calculate time elapsed
     time_elapsed = (datetime.now(timezone.utc) - added_date).total_seconds() / 86400  # in days
-    base_shelf_life = config["base_shelf_life"]
     
     # Calculate temperature deviation factor
-    temp_deviation = abs(current_temp - config["optimal_temp"])
+    temp_deviation = abs(current_temp - optimal_temp)
     temp_factor = 1.0
-    if temp_deviation > config["temp_tolerance"]:
+    if temp_deviation > temp_tolerance:
         # Every degree above tolerance reduces shelf life by 15%
-        temp_factor = 1.0 + (temp_deviation - config["temp_tolerance"]) * 0.15
+        temp_factor = 1.0 + (temp_deviation - temp_tolerance) * 0.15
     
     # Calculate humidity deviation factor
-    humidity_deviation = abs(current_humidity - config["optimal_humidity"])
+    humidity_deviation = abs(current_humidity - optimal_humidity)
     humidity_factor = 1.0
     if humidity_deviation > 20:
         # High humidity deviation reduces shelf life by 5% per 10% deviation
@@ -142,6 +175,214 @@ def calculate_shelf_life(product_type: str, added_date: datetime, current_temp:
     
     return shelf_life_percentage, status, estimated_expiry
 
+def product_config_switch():
+    """Aggregation expression resolving a document's product_type to its config"""
+    product_type = {"$toLower": "$product_type"}
+    return {
+        "$switch": {
+            "branches": [
+                {
+                    "case": {"$eq": [product_type, ptype]},
+                    "then": {"$literal": {
+                        "optimal_temp": config["optimal_temp"],
+                        "temp_tolerance": config["temp_tolerance"],
+                        "optimal_humidity": config["optimal_humidity"],
+                        "base_shelf_life": config["base_shelf_life"]
+                    }}
+                }
+                for ptype, config in PRODUCT_CONFIGS.items()
+            ],
+            "default": None
+        }
+    }
+
+def known_type_filter():
+    """Query clause matching only products whose product_type has a config"""
+    return {"$expr": {"$ne": [product_config_switch(), None]}}
+
+def shelf_life_stages():
+    """Aggregation stages mirroring calculate_shelf_life, evaluated server-side"""
+    # $$NOW (like the pipeline updates in simulate_sensor) requires MongoDB 4.2+,
+    # and added_date must be a BSON date (see migrate_dates.py)
+    recompute = {"$and": [
+        {"$ne": ["$_config", None]},
+        {"$ne": [{"$ifNull": ["$current_temperature", None]}, None]},
+        {"$ne": [{"$ifNull": ["$current_humidity", None]}, None]}
+    ]}
+
+    return [
+        {"$set": {"_config": product_config_switch()}},
+        {"$set": {
+            "_recompute": recompute,
+            # Time elapsed in days
+            "_time_elapsed": {"$divide": [{"$subtract": ["$$NOW", "$added_date"]}, 86400000]},
+            "_temp_deviation": {"$abs": {"$subtract": ["$current_temperature", "$_config.optimal_temp"]}},
+            "_humidity_deviation": {"$abs": {"$subtract": ["$current_humidity", "$_config.optimal_humidity"]}}
+        }},
+        {"$set": {
+            # Every degree above tolerance reduces shelf life by 15%
+            "_temp_factor": {"$cond": [
+                {"$gt": ["$_temp_deviation", "$_config.temp_tolerance"]},
+                {"$add": [1.0, {"$multiply": [{"$subtract": ["$_temp_deviation", "$_config.temp_tolerance"]}, 0.15]}]},
+                1.0
+            ]},
+            # High humidity deviation reduces shelf life by 5% per 10% deviation
+            "_humidity_factor": {"$cond": [
+                {"$gt": ["$_humidity_deviation", 20]},
+                {"$add": [1.0, {"$multiply": [{"$subtract": ["$_humidity_deviation", 20]}, 0.005]}]},
+                1.0
+            ]}
+        }},
+        {"$set": {
+            "_adjusted_shelf_life": {"$divide": [
+                "$_config.base_shelf_life",
+                {"$multiply": ["$_temp_factor", "$_humidity_factor"]}
+            ]}
+        }},
+        {"$set": {
+            "_shelf_life_percentage": {"$max": [0, {"$multiply": [
+                {"$divide": [
+                    {"$subtract": ["$_adjusted_shelf_life", "$_time_elapsed"]},
+                    "$_adjusted_shelf_life"
+                ]},
+                100
+            ]}]}
+        }},
+        {"$set": {
+            "shelf_life_percentage": {"$cond": ["$_recompute", "$_shelf_life_percentage", "$shelf_life_percentage"]},
+            "status": {"$cond": [
+                "$_recompute",
+                {"$switch": {
+                    "branches": [
+                        {"case": {"$gt": ["$_shelf_life_percentage", 70]}, "then": "fresh"},
+                        {"case": {"$gt": ["$_shelf_life_percentage", 40]}, "then": "good"},
+                        {"case": {"$gt": ["$_shelf_life_percentage", 0]}, "then": "warning"}
+                    ],
+                    "default": "expired"
+                }},
+                "$status"
+            ]},
+            "estimated_expiry": {"$cond": [
+                "$_recompute",
+                {"$add": ["$added_date", {"$multiply": ["$_adjusted_shelf_life", 86400000]}]},
+                "$estimated_expiry"
+            ]}
+        }},
+        {"$unset": [
+            "_id", "_config", "_recompute", "_time_elapsed",
+            "_temp_deviation", "_humidity_deviation", "_temp_factor",
+            "_humidity_factor", "_adjusted_shelf_life", "_shelf_life_percentage"
+        ]}
+    ]
+
+# Fields needed to compute and report alerts
+ALERT_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "name": 1,
+    "product_type": 1,
+    "added_date": 1,
+    "current_temperature": 1,
+    "current_humidity": 1,
+    "status": 1,
+    "shelf_life_percentage": 1
+}
+
+ALERT_STATUSES = ["warning", "expired"]
+
+async def fetch_products_with_shelf_life(projection: Optional[dict] = None, statuses: Optional[List[str]] = None):
+    """Get products with shelf life recomputed, optionally only those in the given statuses"""
+    pipeline = [{"$project": projection or {"_id": 0}}] + shelf_life_stages()
+    if statuses:
+        pipeline.append({"$match": {"status": {"$in": statuses}}})
+    return await db.products.aggregate(pipeline).to_list(1000)
+
+def alert_payload(product: dict):
+    """Alert entry for a product in warning or expired status"""
+    return {
+        "product_id": product['id'],
+        "product_name": product['name'],
+        "product_type": product['product_type'],
+        "status": product['status'],
+        "shelf_life_percentage": product['shelf_life_percentage'],
+        "message": f"{product['name']} is {product['status']}!"
+    }
+
+async def fetch_alerts():
+    """Build alert payloads for products in warning or expired status"""
+    products = await fetch_products_with_shelf_life(ALERT_PROJECTION, ALERT_STATUSES)
+    return [alert_payload(product) for product in products]
+
+async def fetch_dashboard():
+    """Get products and alerts from a single $facet aggregation"""
+    # Same 1000-product cap as /products; also keeps the single $facet document
+    # well under the 16 MB BSON limit
+    pipeline = [{"$limit": 1000}, {"$project": {"_id": 0}}] + shelf_life_stages() + [
+        {"$facet": {
+            "products": [{"$match": {}}],
+            "alerts": [
+                {"$match": {"status": {"$in": ALERT_STATUSES}}},
+                # Same shape as alert_payload()
+                {"$project": {
+                    "product_id": "$id",
+                    "product_name": "$name",
+                    "product_type": 1,
+                    "status": 1,
+                    "shelf_life_percentage": 1,
+                    "message": {"$concat": ["$name", " is ", "$status", "!"]}
+                }}
+            ]
+        }}
+    ]
+    result = await db.products.aggregate(pipeline).to_list(1)
+    return result[0]
+
+# Short-lived cache for polled reads; every write route calls clear_read_cache()
+read_cache = TTLCache(maxsize=8, ttl=2)
+read_cache_lock = asyncio.Lock()
+read_cache_generation = 0
+
+def clear_read_cache():
+    """Drop cached reads and discard any fetch still in flight"""
+    global read_cache_generation
+    read_cache_generation += 1
+    read_cache.clear()
+
+async def cached_read(key: str, fetch):
+    """Return a cached read result, calling fetch at most once per TTL"""
+    result = read_cache.get(key)
+    if result is not None:
+        return result
+    async with read_cache_lock:
+        result = read_cache.get(key)
+        if result is None:
+            generation = read_cache_generation
+            result = await fetch()
+            # A write during the fetch may not be reflected in result, so don't cache it
+            if generation == read_cache_generation:
+                read_cache[key] = result
+        return result
+
+def sensor_variations():
+    """Random temperature and humidity offsets from optimal conditions"""
+    temp_variation = random.uniform(-3, 5)  # Can go higher (spoilage scenario)
+    humidity_variation = random.uniform(-10, 15)
+    return temp_variation, humidity_variation
+
+def simulate_reading(product_id: str, product_type: str):
+    """Generate a random sensor reading around the product type's optimal conditions"""
+    config = PRODUCT_CONFIGS[product_type.lower()]
+    temp_variation, humidity_variation = sensor_variations()
+    
+    new_temperature = config["optimal_temp"] + temp_variation
+    new_humidity = config["optimal_humidity"] + humidity_variation
+    
+    return SensorReading(
+        product_id=product_id,
+        temperature=round(new_temperature, 1),
+        humidity=round(new_humidity, 1)
+    )
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -153,22 +394,20 @@ async def create_product(input: ProductCreate):
     if input.product_type.lower() not in PRODUCT_CONFIGS:
         raise HTTPException(status_code=400, detail="Invalid product type")
     
-    product_dict = input.model_dump()
-    product_obj = Product(**product_dict)
-    
-    # Initialize with optimal conditions
+    # Input is already validated, so build the product without re-validating it
+    # and initialize with optimal conditions
     config = PRODUCT_CONFIGS[input.product_type.lower()]
-    product_obj.current_temperature = config["optimal_temp"]
-    product_obj.current_humidity = config["optimal_humidity"]
-    product_obj.estimated_expiry = product_obj.added_date + timedelta(days=config["base_shelf_life"])
-    
-    # Convert to dict and serialize datetime to ISO string for MongoDB
-    doc = product_obj.model_dump()
-    doc['added_date'] = doc['added_date'].isoformat()
-    if doc['estimated_expiry']:
-        doc['estimated_expiry'] = doc['estimated_expiry'].isoformat()
-    
-    await db.products.insert_one(doc)
+    added_date = datetime.now(timezone.utc)
+    product_obj = Product.model_construct(
+        **input.model_dump(),
+        id=str(uuid.uuid4()),
+        added_date=added_date,
+        current_temperature=config["optimal_temp"],
+        current_humidity=config["optimal_humidity"],
+        status="fresh",
+        shelf_life_percentage=100.0,
+        estimated_expiry=added_date + timedelta(days=config["base_shelf_life"])
+    )
     
     # Create initial sensor reading
     sensor_reading = SensorReading(
@@ -176,51 +415,29 @@ async def create_product(input: ProductCreate):
         temperature=product_obj.current_temperature,
         humidity=product_obj.current_humidity
     )
-    sensor_doc = sensor_reading.model_dump()
-    sensor_doc['timestamp'] = sensor_doc['timestamp'].isoformat()
-    await db.sensor_readings.insert_one(sensor_doc)
     
+    # Both inserts target different collections, so issue them concurrently
+    await asyncio.gather(
+        db.products.insert_one(product_obj.model_dump()),
+        db.sensor_readings.insert_one(sensor_reading.model_dump())
+    )
+    
+    clear_read_cache()
     return product_obj
 
-@api_router.get("/products", response_model=List[Product])
+@api_router.get("/products")
 async def get_products():
     """Get all products with updated status"""
-    products = await db.products.find({}, {"_id": 0}).to_list(1000)
-    
-    # Convert ISO strings back to datetime and update status
-    for product in products:
-        if isinstance(product['added_date'], str):
-            product['added_date'] = datetime.fromisoformat(product['added_date'])
-        if product.get('estimated_expiry') and isinstance(product['estimated_expiry'], str):
-            product['estimated_expiry'] = datetime.fromisoformat(product['estimated_expiry'])
-        
-        # Recalculate shelf life with current conditions
-        if product.get('current_temperature') is not None and product.get('current_humidity') is not None:
-            shelf_life_percentage, status, estimated_expiry = calculate_shelf_life(
-                product['product_type'],
-                product['added_date'],
-                product['current_temperature'],
-                product['current_humidity']
-            )
-            product['shelf_life_percentage'] = shelf_life_percentage
-            product['status'] = status
-            product['estimated_expiry'] = estimated_expiry
-    
-    return products
+    # Documents are already in Product shape, so encode them without re-validation
+    return ORJSONResponse(await cached_read("products", fetch_products_with_shelf_life))
 
-@api_router.get("/products/{product_id}", response_model=Product)
+@api_router.get("/products/{product_id}")
 async def get_product(product_id: str):
     """Get a specific product"""
     product = await db.products.find_one({"id": product_id}, {"_id": 0})
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    # Convert ISO strings back to datetime
-    if isinstance(product['added_date'], str):
-        product['added_date'] = datetime.fromisoformat(product['added_date'])
-    if product.get('estimated_expiry') and isinstance(product['estimated_expiry'], str):
-        product['estimated_expiry'] = datetime.fromisoformat(product['estimated_expiry'])
-    
     # Recalculate shelf life
     if product.get('current_temperature') is not None and product.get('current_humidity') is not None:
         shelf_life_percentage, status, estimated_expiry = calculate_shelf_life(
@@ -245,102 +462,103 @@ async def delete_product(product_id: str):
     # Also delete associated sensor readings
     await db.sensor_readings.delete_many({"product_id": product_id})
     
+    clear_read_cache()
     return {"message": "Product deleted successfully"}
 
-@api_router.get("/sensor-data/{product_id}", response_model=List[SensorReading])
-async def get_sensor_data(product_id: str, limit: int = 50):
+@api_router.get("/sensor-data/{product_id}")
+async def get_sensor_data(product_id: str, limit: int = Query(50, ge=1)):
     """Get sensor readings for a product"""
-    readings = await db.sensor_readings.find(
-        {"product_id": product_id},
-        {"_id": 0}
-    ).sort("timestamp", -1).limit(limit).to_list(limit)
-    
-    # Convert ISO strings back to datetime
-    for reading in readings:
-        if isinstance(reading['timestamp'], str):
-            reading['timestamp'] = datetime.fromisoformat(reading['timestamp'])
-    
-    return readings[::-1]  # Return in chronological order
+    # Take the latest readings via the index, then return them in chronological order
+    pipeline = [
+        {"$match": {"product_id": product_id}},
+        {"$sort": {"timestamp": -1}},
+        {"$limit": limit},
+        {"$sort": {"timestamp": 1}},
+        {"$project": {"_id": 0}}
+    ]
+    return ORJSONResponse(await db.sensor_readings.aggregate(pipeline).to_list(limit))
 
 @api_router.post("/simulate-sensor/{product_id}")
 async def simulate_sensor(product_id: str):
     """Simulate sensor reading for a product"""
-    product = await db.products.find_one({"id": product_id}, {"_id": 0})
+    temp_variation, humidity_variation = sensor_variations()
+    
+    # Apply the variations to the product type's optimal conditions server-side
+    # and read the new values back in the same round trip. Unknown product types
+    # don't match, so nothing is written for them.
+    product = await db.products.find_one_and_update(
+        {"id": product_id, **known_type_filter()},
+        [
+            {"$set": {"_config": product_config_switch()}},
+            {"$set": {
+                "current_temperature": {"$round": [{"$add": ["$_config.optimal_temp", temp_variation]}, 1]},
+                "current_humidity": {"$round": [{"$add": ["$_config.optimal_humidity", humidity_variation]}, 1]}
+            }},
+            {"$unset": "_config"}
+        ],
+        projection={"_id": 0, "current_temperature": 1, "current_humidity": 1},
+        return_document=ReturnDocument.AFTER
+    )
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    config = PRODUCT_CONFIGS[product['product_type'].lower()]
-    
-    # Simulate temperature and humidity with random variations
-    temp_variation = random.uniform(-3, 5)  # Can go higher (spoilage scenario)
-    humidity_variation = random.uniform(-10, 15)
-    
-    new_temperature = config["optimal_temp"] + temp_variation
-    new_humidity = config["optimal_humidity"] + humidity_variation
-    
-    # Create sensor reading
     sensor_reading = SensorReading(
         product_id=product_id,
-        temperature=round(new_temperature, 1),
-        humidity=round(new_humidity, 1)
-    )
-    sensor_doc = sensor_reading.model_dump()
-    sensor_doc['timestamp'] = sensor_doc['timestamp'].isoformat()
-    await db.sensor_readings.insert_one(sensor_doc)
-    
-    # Update product with latest readings
-    await db.products.update_one(
-        {"id": product_id},
-        {"$set": {
-            "current_temperature": sensor_reading.temperature,
-            "current_humidity": sensor_reading.humidity
-        }}
+        temperature=product['current_temperature'],
+        humidity=product['current_humidity']
     )
+    await db.sensor_readings.insert_one(sensor_reading.model_dump())
     
+    clear_read_cache()
     return sensor_reading
 
+@api_router.post("/simulate-sensors", response_model=List[SensorReading])
+async def simulate_sensors(input: SensorSimulationRequest):
+    """Simulate sensor readings for several products in one batch"""
+    products = await db.products.find(
+        {"id": {"$in": input.product_ids}, **known_type_filter()},
+        {"_id": 0, "id": 1, "product_type": 1}
+    ).to_list(len(input.product_ids))
+    if not products:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    # bulk_write returns no documents, so unlike simulate_sensor the readings are
+    # computed here from the fetched types. Both routes use the same
+    # sensor_variations() offsets and round to one decimal.
+    sensor_readings = [simulate_reading(product['id'], product['product_type']) for product in products]
+    await db.sensor_readings.insert_many([reading.model_dump() for reading in sensor_readings])
+    
+    # Update products with latest readings
+    await db.products.bulk_write([
+        UpdateOne(
+            {"id": reading.product_id},
+            {"$set": {
+                "current_temperature": reading.temperature,
+                "current_humidity": reading.humidity
+            }}
+        )
+        for reading in sensor_readings
+    ], ordered=False)
+    
+    clear_read_cache()
+    return sensor_readings
+
 @api_router.get("/product-types")
-async def get_product_types():
+async def get_product_types(response: Response):
     """Get available product types"""
-    return [
-        {
-            "type": ptype,
-            "icon": config["icon"],
-            "optimal_temp": config["optimal_temp"],
-            "shelf_life_days": config["base_shelf_life"]
-        }
-        for ptype, config in PRODUCT_CONFIGS.items()
-    ]
+    # PRODUCT_CONFIGS is static, so clients may cache this for a day
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    return PRODUCT_TYPES
+
+@api_router.get("/dashboard")
+async def get_dashboard():
+    """Get all products and current alerts in one round trip"""
+    return ORJSONResponse(await cached_read("dashboard", fetch_dashboard))
 
 @api_router.get("/alerts")
 async def get_alerts():
     """Get products that need attention (warning or expired)"""
-    products = await db.products.find({}, {"_id": 0}).to_list(1000)
-    
-    alerts = []
-    for product in products:
-        if isinstance(product['added_date'], str):
-            product['added_date'] = datetime.fromisoformat(product['added_date'])
-        
-        if product.get('current_temperature') is not None and product.get('current_humidity') is not None:
-            shelf_life_percentage, status, _ = calculate_shelf_life(
-                product['product_type'],
-                product['added_date'],
-                product['current_temperature'],
-                product['current_humidity']
-            )
-            
-            if status in ["warning", "expired"]:
-                alerts.append({
-                    "product_id": product['id'],
-                    "product_name": product['name'],
-                    "product_type": product['product_type'],
-                    "status": status,
-                    "shelf_life_percentage": shelf_life_percentage,
-                    "message": f"{product['name']} is {status}!"
-                })
-    
-    return alerts
+    return await cached_read("alerts", fetch_alerts)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -360,6 +578,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    # Lookups filter by id/product_id; sensor history is read newest-first
+    await db.products.create_index("id", unique=True)
+    await db.sensor_readings.create_index([("product_id", 1), ("timestamp", -1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop event loop and httptools parser. app_dir lets this run from any
+    # working directory. Each worker opens its own Mongo pool (MONGO_MIN_POOL_SIZE
+    # connections up front), so raise WEB_CONCURRENCY deliberately.
+    uvicorn.run(
+        "server:app",
+        app_dir=str(ROOT_DIR),
+        host="0.0.0.0",
+        port=int(os.environ.get('PORT', '8001')),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get('WEB_CONCURRENCY', '1'))
+    )
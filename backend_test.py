@@ -3,6 +3,7 @@ import sys
 import json
 from datetime import datetime
 import time
+import uuid
 
 class MilkShelfLifeAPITester:
     def __init__(self, base_url="https://milkshelf.preview.emergentagent.com"):
@@ -120,6 +121,40 @@ class MilkShelfLifeAPITester:
             200
         )
 
+    def test_simulate_sensors(self, product_ids):
+        """Test batch sensor simulation"""
+        unknown_id = str(uuid.uuid4())
+        success, data = self.run_test(
+            "Simulate Sensors - known and unknown ids",
+            "POST",
+            "simulate-sensors",
+            200,
+            {"product_ids": product_ids + [unknown_id]}
+        )
+        if success:
+            returned_ids = sorted(reading['product_id'] for reading in data) if isinstance(data, list) else []
+            self.log_test(
+                "Simulate Sensors - one reading per known id",
+                returned_ids == sorted(product_ids),
+                f"Expected: {sorted(product_ids)}, Got: {returned_ids}"
+            )
+        
+        self.run_test(
+            "Simulate Sensors - all unknown ids",
+            "POST",
+            "simulate-sensors",
+            404,
+            {"product_ids": [unknown_id]}
+        )
+        self.run_test(
+            "Simulate Sensors - empty id list",
+            "POST",
+            "simulate-sensors",
+            422,
+            {"product_ids": []}
+        )
+        return success, data
+
     def test_get_sensor_data(self, product_id):
         """Test getting sensor data"""
         return self.run_test(
@@ -133,6 +168,29 @@ class MilkShelfLifeAPITester:
         """Test getting alerts"""
         return self.run_test("Get Alerts", "GET", "alerts", 200)
 
+    def test_get_dashboard(self):
+        """Test getting products and alerts in one response"""
+        success, data = self.run_test("Get Dashboard", "GET", "dashboard", 200)
+        if not success:
+            return success, data
+        
+        products = data.get('products') if isinstance(data, dict) else None
+        alerts = data.get('alerts') if isinstance(data, dict) else None
+        self.log_test(
+            "Dashboard - products and alerts lists",
+            isinstance(products, list) and isinstance(alerts, list),
+            f"Keys: {list(data) if isinstance(data, dict) else type(data).__name__}"
+        )
+        if isinstance(products, list):
+            product_ids = {product['id'] for product in products}
+            missing = [pid for pid in self.created_products if pid not in product_ids]
+            self.log_test("Dashboard - includes created products", not missing, f"Missing: {missing}")
+        if isinstance(alerts, list):
+            alert_fields = {"product_id", "product_name", "product_type", "status", "shelf_life_percentage", "message"}
+            bad_alerts = [alert for alert in alerts if set(alert) != alert_fields]
+            self.log_test("Dashboard - alerts match /alerts shape", not bad_alerts, f"Unexpected: {bad_alerts[:2]}")
+        return success, data
+
     def test_delete_product(self, product_id):
         """Test deleting a product"""
         return self.run_test(
@@ -219,10 +277,16 @@ class MilkShelfLifeAPITester:
             if success and isinstance(sensor_data, list) and len(sensor_data) > 0:
                 print(f"   ✓ Found {len(sensor_data)} sensor readings")
 
-        # Test 6: Get alerts
+        # Test 6: Batch sensor simulation
+        self.test_simulate_sensors(self.created_products)
+
+        # Test 7: Get alerts
         self.test_get_alerts()
 
-        # Test 7: Delete products (cleanup)
+        # Test 8: Dashboard (products + alerts)
+        self.test_get_dashboard()
+
+        # Test 9: Delete products (cleanup)
         for product_id in self.created_products:
             self.test_delete_product(product_id)
 
@@ -46,12 +46,9 @@ const Dashboard = () => {
 
   const fetchData = async () => {
     try {
-      const [productsRes, alertsRes] = await Promise.all([
-        axios.get(`${API}/products`),
-        axios.get(`${API}/alerts`)
-      ]);
-      setProducts(productsRes.data);
-      setAlerts(alertsRes.data);
+      const response = await axios.get(`${API}/dashboard`);
+      setProducts(response.data.products);
+      setAlerts(response.data.alerts);
       setLoading(false);
     } catch (error) {
       console.error("Error fetching data:", error);